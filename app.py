@@ -1,19 +1,42 @@
+import hashlib
+import io
+import logging
+import warnings
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
+import numpy as np
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+import plotly.graph_objects as go
+from core.cache import load_cached_frame, store_cached_frame
 from core.report import generate_html_report
 from core.analyzer import (
+    build_stats,
     profile_data, 
+    format_profile_value,
     analyze_columns, 
     create_histogram, 
     create_barplot,
     create_correlation_heatmap,
     get_health_report,
+    format_health_report,
     detect_outliers,
     create_bivariate_categorical_plot,
     create_numerical_vs_categorical_plot,
     get_ml_suggestions
 )
 
+logger = logging.getLogger(__name__)
+
+def debug_enabled() -> bool:
+    """Full tracebacks are only rendered in the page when `debug = true` is set in the app's secrets."""
+    try:
+        return bool(st.secrets.get("debug", False))
+    except FileNotFoundError:
+        # No secrets.toml at all
+        return False
+
 # --- 1. Page Configuration ---
 st.set_page_config(
     page_title="InstantEDA",
@@ -40,153 +63,304 @@ uploaded_file = st.file_uploader(
 
 def smart_datetime_converter(df: pd.DataFrame) -> pd.DataFrame:
     """Intelligently convert object columns to datetime if they look like dates."""
+    rng = np.random.default_rng()
     for col in df.select_dtypes(include=['object']).columns:
-        # Take a sample of up to 50 non-null values
-        sample = df[col].dropna().sample(n=min(50, len(df[col].dropna())))
+        # Sample up to 50 non-null values straight from the underlying array, without a dropna() copy
+        series = df[col]
+        values = series.to_numpy()
+        non_null_idx = np.flatnonzero(pd.notna(values))
         
-        # If the sample is empty, skip
-        if sample.empty:
+        # If there are no non-null values, skip
+        if non_null_idx.size == 0:
             continue
+        sample = values[rng.choice(non_null_idx, size=min(50, non_null_idx.size), replace=False)]
             
-        # Try converting the sample
+        # Parse with the single format most sample values follow, which keeps the whole column on the strptime
+        # fast path and turns values in any other format into NaT. format='mixed' parses each element on its
+        # own (through dateutil for non-ISO strings) and is only the fallback when no format can be guessed.
+        with warnings.catch_warnings():
+            # Guessing warns about every day-first value it recognises; a format is passed explicitly below
+            warnings.simplefilter('ignore', UserWarning)
+            guessed = Counter(guess_datetime_format(value) for value in sample if isinstance(value, str))
+        guessed.pop(None, None)
+        date_format = guessed.most_common(1)[0][0] if guessed else 'mixed'
         try:
-            converted_sample = pd.to_datetime(sample, errors='raise')
+            converted_sample = pd.to_datetime(sample, errors='coerce', format=date_format)
             # If a high percentage of the sample are dates, convert the whole column
-            if (converted_sample.notna().sum() / len(sample)) > 0.8:
-                # Use errors='coerce' on the full column in case of a few bad entries
-                df[col] = pd.to_datetime(df[col], errors='coerce')
+            if converted_sample.notna().mean() > 0.8:
+                # Use errors='coerce' on the full column in case of a few bad entries; cache=True parses
+                # each distinct string only once
+                df[col] = pd.to_datetime(series, errors='coerce', format=date_format, cache=True)
         except (ValueError, TypeError):
-            # If the sample conversion fails, it's definitely not a datetime column
+            # Values that cannot be coerced (e.g. mixed timezones) mean this is not a datetime column
             continue
     return df
 
+def categorize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Store low-cardinality object columns as pandas categoricals."""
+    total_rows = max(len(df), 1)
+    for col in df.select_dtypes(include=['object']).columns:
+        # value_counts, nunique and duplicated then work on small integer codes instead of hashing strings.
+        # One sorted factorize both measures cardinality and yields the codes astype('category') would build.
+        codes, uniques = pd.factorize(df[col], sort=True)
+        n_unique = len(uniques) + bool((codes < 0).any())  # nunique(dropna=False) also counts NaN
+        if n_unique / total_rows < 0.5:
+            df[col] = pd.Categorical.from_codes(codes, categories=uniques)
+    return df
+
+def arrow_string_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Store the remaining free-text columns as Arrow-backed strings."""
+    # Arrow string buffers take ~4x less memory than object arrays of Python str, and isna, value_counts and
+    # duplicated run as Arrow compute kernels. Numeric columns stay on NumPy for the BLAS and numba paths.
+    try:
+        arrow_string = pd.StringDtype("pyarrow")
+    except ImportError:
+        return df
+    for col in df.columns:
+        dtype = df[col].dtype
+        # Only all-str object columns convert, since mixed ones would be stringified
+        is_text = dtype == object and pd.api.types.infer_dtype(df[col], skipna=True) == "string"
+        # Parquet cache hits come back as python-storage strings
+        is_python_string = isinstance(dtype, pd.StringDtype) and dtype.storage != "pyarrow"
+        if is_text or is_python_string:
+            df[col] = df[col].astype(arrow_string)
+    return df
+
+# --- Cached Pipeline ---
+# Streamlit reruns the whole script on every widget interaction, so everything derived from the
+# upload is cached and keyed on the SHA-256 of the file bytes. Underscore-prefixed arguments are
+# skipped by Streamlit's hasher, which keeps tab switches from re-hashing the full DataFrame.
+# The DataFrame and figures go through st.cache_resource (shared, returned without copying) and
+# must be treated as read-only; the small analysis results use st.cache_data.
+# These caches are process-wide, so each is bounded: entries expire after CACHE_TTL, and only the most
+# recent few uploads (and figures) are kept in server memory.
+CACHE_TTL = "1h"
+MAX_CACHED_FILES = 2
+MAX_CACHED_FIGURES = 64
+
+@st.cache_resource(show_spinner=False, max_entries=MAX_CACHED_FILES, ttl=CACHE_TTL)
+def load_data(file_hash: str, _file_bytes: bytes) -> pd.DataFrame:
+    # A previous server process may already have preprocessed this exact file
+    df = load_cached_frame(file_hash)
+    if df is not None:
+        # Parquet decodes bool-valued categoricals as object and strings with python storage, so both
+        # conversions are re-applied to give the same dtypes as a miss
+        return arrow_string_columns(categorize_columns(df))
+
+    try:
+        # The Arrow tokenizer parses with multiple threads and already infers ISO timestamps
+        df = pd.read_csv(io.BytesIO(_file_bytes), engine='pyarrow')
+        # pyarrow also keeps empty header names (e.g. the index column of any DataFrame.to_csv() output);
+        # name them by position as the C engine does
+        df.columns = [f"Unnamed: {i}" if name == "" else name for i, name in enumerate(df.columns)]
+        if df.columns.has_duplicates:
+            # Unlike the C engine, pyarrow keeps repeated header names, so df[col] would return a frame;
+            # re-read so they are renamed to 'name', 'name.1', ...
+            df = pd.read_csv(io.BytesIO(_file_bytes))
+    except (ImportError, ValueError):
+        # pyarrow is not installed, or the file uses something its parser rejects (e.g. ragged rows)
+        df = pd.read_csv(io.BytesIO(_file_bytes))
+
+    df = arrow_string_columns(categorize_columns(smart_datetime_converter(df)))
+
+    store_cached_frame(file_hash, df)
+    return df
+
+# The numeric block is selected once per file and shared by the stats, outlier scan and heatmap
+@st.cache_resource(show_spinner=False, max_entries=MAX_CACHED_FILES, ttl=CACHE_TTL)
+def numeric_view(file_hash: str, _df: pd.DataFrame) -> pd.DataFrame:
+    return _df.select_dtypes(include=np.number)
+
+@st.cache_data(show_spinner=False, max_entries=MAX_CACHED_FILES, ttl=CACHE_TTL)
+def run_analyses(file_hash: str, _df: pd.DataFrame) -> tuple:
+    # Every analysis reads the same per-column statistics instead of rescanning the frame
+    numeric_df = numeric_view(file_hash, _df)
+    stats = build_stats(_df, numeric_df=numeric_df)
+    return (
+        profile_data(_df, stats),
+        analyze_columns(_df, stats),
+        get_health_report(_df, stats),
+        detect_outliers(_df, stats, numeric_df),
+        get_ml_suggestions(_df, stats)
+    )
+
+def create_univariate_fig(df: pd.DataFrame, col: str):
+    if pd.api.types.is_numeric_dtype(df[col]):
+        return create_histogram(df, col)
+    return create_barplot(df, col)
+
+# Figures are built on demand: only the column the user selects is plotted on a normal rerun
+@st.cache_resource(show_spinner=False, max_entries=MAX_CACHED_FIGURES, ttl=CACHE_TTL)
+def build_univariate_fig(file_hash: str, col: str, _df: pd.DataFrame):
+    # st.plotly_chart re-validates dict specs on every call but only serializes a Figure, so validate once here
+    return go.Figure(create_univariate_fig(_df, col))
+
+@st.cache_resource(show_spinner=False, max_entries=MAX_CACHED_FILES, ttl=CACHE_TTL)
+def build_correlation_fig(file_hash: str, _df: pd.DataFrame):
+    return create_correlation_heatmap(_df, numeric_view(file_hash, _df))
+
+# The HTML report is the only consumer that needs every figure, so it is built once per file on request
+@st.cache_data(show_spinner=False, max_entries=MAX_CACHED_FILES, ttl=CACHE_TTL)
+def build_report(file_hash: str, _df: pd.DataFrame, _analyses: tuple) -> str:
+    # Binning and value_counts release the GIL inside NumPy/pandas, so columns build in parallel
+    with ThreadPoolExecutor() as executor:
+        figs = executor.map(lambda col: create_univariate_fig(_df, col), _df.columns)
+        univariate_figs = dict(zip(_df.columns, figs))
+
+    profile, column_summary, health_report, outlier_report, ml_suggestions = _analyses
+    return generate_html_report(
+        profile,
+        column_summary,
+        health_report,
+        outlier_report,
+        univariate_figs,
+        build_correlation_fig(file_hash, _df),
+        ml_suggestions
+    )
+
+# Bounds on the row/column slice of the upload shown in the Data Preview
+PREVIEW_ROWS = 10
+PREVIEW_MAX_COLUMNS = 50
+
+# --- Tab Fragments ---
+# Each fragment reruns on its own when one of its widgets changes, instead of rerunning the whole script
+@st.fragment
+def univariate_tab(file_hash: str, df: pd.DataFrame):
+    st.header("Univariate Analysis")
+    selected_col_uni = st.selectbox("Select a column:", df.columns, key="univariate")
+    if selected_col_uni:
+        st.plotly_chart(build_univariate_fig(file_hash, selected_col_uni, df), use_container_width=True)
+
+@st.fragment
+def bivariate_tab(file_hash: str, df: pd.DataFrame, numerical_cols: list, categorical_cols: list):
+    st.header("Bivariate Analysis")
+    bivariate_type = st.radio("Choose analysis type:", ("Numerical vs Numerical", "Numerical vs Categorical", "Categorical vs Categorical"), horizontal=True, key="biv_radio")
+    if bivariate_type == "Numerical vs Numerical":
+        st.subheader("Correlation Heatmap")
+        st.plotly_chart(build_correlation_fig(file_hash, df), use_container_width=True)
+    elif bivariate_type == "Numerical vs Categorical":
+        c1, c2 = st.columns(2)
+        num_col = c1.selectbox("Select a numerical column:", numerical_cols, key="biv_num")
+        cat_col = c2.selectbox("Select a categorical column:", categorical_cols, key="biv_cat_num")
+        if num_col and cat_col:
+            fig = create_numerical_vs_categorical_plot(df, num_col, cat_col)
+            st.plotly_chart(fig, use_container_width=True)
+    elif bivariate_type == "Categorical vs Categorical":
+        c1, c2 = st.columns(2)
+        cat_col1 = c1.selectbox("Select first categorical column:", categorical_cols, key="biv_cat1")
+        cat_col2 = c2.selectbox("Select second categorical column:", categorical_cols, key="biv_cat2", index=min(1, len(categorical_cols)-1))
+        if cat_col1 and cat_col2:
+            if cat_col1 == cat_col2: st.warning("Please select two different columns.")
+            else:
+                fig = create_bivariate_categorical_plot(df, cat_col1, cat_col2)
+                st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def ml_tab(ml_suggestions: dict):
+    st.header("Machine Learning Preprocessing Suggestions")
+    st.info("These are heuristic-based suggestions. Always validate with domain knowledge.")
+    for col_name, details in ml_suggestions.items():
+        with st.expander(f"**{col_name}** (Identified as: *{details.get('role', 'Unknown')}*)"):
+            st.markdown(f"**Suggestion:** {details.get('suggestion', 'N/A')}")
+            st.markdown("**Example Code:**")
+            st.code(details.get('code', '# N/A'), language='python')
+
+@st.fragment
+def alerts_tab(health_report: dict, outlier_report: dict):
+    st.header("Data Health Report")
+    if not any(v for k, v in health_report.items() if v): st.success("No major data health issues detected.")
+    else:
+        health_report = format_health_report(health_report)
+        if health_report.get("high_missing_values"): st.warning(f"**High Missing Values (>50%):** {', '.join(health_report['high_missing_values'])}")
+        if health_report.get("constant_columns"): st.warning(f"**Constant Columns:** {', '.join(health_report['constant_columns'])}")
+        if health_report.get("high_cardinality_columns"): st.info(f"**High Cardinality (Potential IDs):** {', '.join(health_report['high_cardinality_columns'])}")
+    st.markdown("---")
+    st.header("Outlier Report (IQR Method)")
+    if not outlier_report: st.success("No significant outliers were detected.")
+    else:
+        for col_name, details in outlier_report.items():
+            with st.expander(f"**{col_name}** - Found {details['count']} outliers ({details['percentage']:.2f}%)"):
+                st.write(f"Sample Outlier Values: `{details['sample_values']}`")
+                st.write("These values fall outside the 1.5 * IQR range and may warrant investigation.")
+
 # --- 4. Main Application Logic ---
 if uploaded_file is not None:
     try:
         # --- Data Loading and Preprocessing ---
-        df = pd.read_csv(uploaded_file)
-        df = smart_datetime_converter(df)
+        file_bytes = uploaded_file.getvalue()
+        file_hash = hashlib.sha256(file_bytes).hexdigest()
+        df = load_data(file_hash, file_bytes)
 
 
         st.success("File processed successfully!")
         
         # --- Pre-compute all tabular/text analyses ---
-        profile = profile_data(df)
-        column_summary = analyze_columns(df)
-        health_report = get_health_report(df)
-        outlier_report = detect_outliers(df)
-        ml_suggestions = get_ml_suggestions(df)
-        
-        # --- Pre-generate all plots ---
-        with st.spinner("Generating all visualizations..."):
-            correlation_fig = create_correlation_heatmap(df)
-            univariate_figs = {}
-            for col in df.columns:
-                if pd.api.types.is_numeric_dtype(df[col]):
-                    univariate_figs[col] = create_histogram(df, col)
-                else:
-                    univariate_figs[col] = create_barplot(df, col)
+        analyses = run_analyses(file_hash, df)
+        profile, column_summary, health_report, outlier_report, ml_suggestions = analyses
 
         # Get column lists for UI selectors
-        categorical_cols = df.select_dtypes(include=['object', 'category', 'datetime64[ns]']).columns.tolist()
-        numerical_cols = df.select_dtypes(include=['int64', 'float64']).columns.tolist()
+        categorical_cols = df.select_dtypes(include=['object', 'string', 'category', 'datetime']).columns.tolist()
+        numerical_cols = numeric_view(file_hash, df).columns.tolist()
         
         # --- 5. Download Button ---
         with main_col2:
             st.write("###  ") 
             st.write("### Download Report")
             
-            # Generate the HTML report 
-            report_html = generate_html_report(
-                profile,
-                column_summary,
-                health_report,
-                outlier_report,
-                univariate_figs,
-                correlation_fig,
-                ml_suggestions
-            )
-            st.download_button(
-                label="📥 Download Full HTML Report",
-                data=report_html,
-                file_name="InstantEDA_Full_Report.html",
-                mime="text/html"
-            )
+            # Generate the HTML report only once the user asks for it
+            if st.session_state.get("report_hash") != file_hash:
+                if st.button("📝 Generate Full HTML Report"):
+                    with st.spinner("Generating all visualizations..."):
+                        st.session_state["report_html"] = build_report(file_hash, df, analyses)
+                        st.session_state["report_hash"] = file_hash
+            if st.session_state.get("report_hash") == file_hash:
+                st.download_button(
+                    label="📥 Download Full HTML Report",
+                    data=st.session_state["report_html"],
+                    file_name="InstantEDA_Full_Report.html",
+                    mime="text/html"
+                )
 
         # --- 6. Tabbed Interface ---
         tab1, tab2, tab3, tab4 = st.tabs(["📊 Data Overview", "📈 Variable Analysis", "🤖 ML Suggestions", "⚠️ Alerts & Outliers"])
         
         with tab1:
             st.header("Data Preview")
-            st.dataframe(df.head())
+            # Only a bounded slice is serialized to the front end, however wide the upload is
+            if len(df.columns) > PREVIEW_MAX_COLUMNS:
+                st.caption(f"Showing the first {PREVIEW_MAX_COLUMNS} of {len(df.columns)} columns.")
+            # Slice rows and columns together so only the preview cells are copied, not every row
+            st.dataframe(df.iloc[:PREVIEW_ROWS, :PREVIEW_MAX_COLUMNS], use_container_width=True, height=300)
             st.markdown("---")
             st.header("Data Profile")
             p_col1, p_col2, p_col3, p_col4 = st.columns(4)
             p_col1.metric("Number of Rows", profile["Number of Rows"])
             p_col2.metric("Number of Columns", profile["Number of Columns"])
-            p_col3.metric("Missing Cells", profile["Total Missing Cells"])
-            p_col4.metric("Duplicate Rows", profile["Total Duplicate Rows"])
+            p_col3.metric("Missing Cells", format_profile_value(profile["Total Missing Cells"]))
+            p_col4.metric("Duplicate Rows", format_profile_value(profile["Total Duplicate Rows"]))
             st.markdown("---")
             st.header("Column-wise Analysis")
-            st.dataframe(column_summary)
+            st.dataframe(column_summary.reset_index(), use_container_width=True, hide_index=True,
+                         column_config={"Missing Values (%)": st.column_config.NumberColumn(format="%.2f")})
 
         with tab2:
-            st.header("Univariate Analysis")
-            selected_col_uni = st.selectbox("Select a column:", df.columns, key="univariate")
-            if selected_col_uni:
-                st.plotly_chart(univariate_figs[selected_col_uni], use_container_width=True)
+            univariate_tab(file_hash, df)
             st.markdown("---")
-            
-            st.header("Bivariate Analysis")
-            bivariate_type = st.radio("Choose analysis type:", ("Numerical vs Numerical", "Numerical vs Categorical", "Categorical vs Categorical"), horizontal=True, key="biv_radio")
-            if bivariate_type == "Numerical vs Numerical":
-                st.subheader("Correlation Heatmap")
-                st.plotly_chart(correlation_fig, use_container_width=True)
-            elif bivariate_type == "Numerical vs Categorical":
-                c1, c2 = st.columns(2)
-                num_col = c1.selectbox("Select a numerical column:", numerical_cols, key="biv_num")
-                cat_col = c2.selectbox("Select a categorical column:", categorical_cols, key="biv_cat_num")
-                if num_col and cat_col:
-                    fig = create_numerical_vs_categorical_plot(df, num_col, cat_col)
-                    st.plotly_chart(fig, use_container_width=True)
-            elif bivariate_type == "Categorical vs Categorical":
-                c1, c2 = st.columns(2)
-                cat_col1 = c1.selectbox("Select first categorical column:", categorical_cols, key="biv_cat1")
-                cat_col2 = c2.selectbox("Select second categorical column:", categorical_cols, key="biv_cat2", index=min(1, len(categorical_cols)-1))
-                if cat_col1 and cat_col2:
-                    if cat_col1 == cat_col2: st.warning("Please select two different columns.")
-                    else:
-                        fig = create_bivariate_categorical_plot(df, cat_col1, cat_col2)
-                        st.plotly_chart(fig, use_container_width=True)
+            bivariate_tab(file_hash, df, numerical_cols, categorical_cols)
 
         with tab3:
-            st.header("Machine Learning Preprocessing Suggestions")
-            st.info("These are heuristic-based suggestions. Always validate with domain knowledge.")
-            for col_name, details in ml_suggestions.items():
-                with st.expander(f"**{col_name}** (Identified as: *{details.get('role', 'Unknown')}*)"):
-                    st.markdown(f"**Suggestion:** {details.get('suggestion', 'N/A')}")
-                    st.markdown("**Example Code:**")
-                    st.code(details.get('code', '# N/A'), language='python')
+            ml_tab(ml_suggestions)
         
         with tab4:
-            st.header("Data Health Report")
-            if not any(v for k, v in health_report.items() if v): st.success("No major data health issues detected.")
-            else:
-                if health_report.get("high_missing_values"): st.warning(f"**High Missing Values (>50%):** {', '.join([f'{col} ({pct})' for col, pct in health_report['high_missing_values']])}")
-                if health_report.get("constant_columns"): st.warning(f"**Constant Columns:** {', '.join(health_report['constant_columns'])}")
-                if health_report.get("high_cardinality_columns"): st.info(f"**High Cardinality (Potential IDs):** {', '.join(health_report['high_cardinality_columns'])}")
-            st.markdown("---")
-            st.header("Outlier Report (IQR Method)")
-            if not outlier_report: st.success("No significant outliers were detected.")
-            else:
-                for col_name, details in outlier_report.items():
-                    with st.expander(f"**{col_name}** - Found {details['count']} outliers ({details['percentage']})"):
-                        st.write(f"Sample Outlier Values: `{details['sample_values']}`")
-                        st.write("These values fall outside the 1.5 * IQR range and may warrant investigation.")
+            alerts_tab(health_report, outlier_report)
                         
     except Exception as e:
         st.error(f"An error occurred during processing: {e}")
-        st.exception(e)
+        # A rendered traceback is a large element tree; only build it when debugging, otherwise log it
+        if debug_enabled():
+            st.exception(e)
+        else:
+            logger.exception("Failed to process uploaded file")
 
 else:
     st.info(" Upload a CSV file to see the magic happen!")
\ No newline at end of file
@@ -1,119 +1,328 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.graph_objects import Figure
 
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba is optional; without it detect_outliers uses the NumPy mask path
+    njit = None
+
+# Histograms are binned in NumPy and shipped to the browser as at most this many pre-computed bars
+MAX_HISTOGRAM_BINS = 256
+# Heatmaps show at most this many (most variable) columns, and drop per-cell text annotations, which are
+# rendered as one SVG node each, above HEATMAP_TEXT_MAX_COLUMNS
+HEATMAP_MAX_COLUMNS = 30
+HEATMAP_TEXT_MAX_COLUMNS = 15
+# Numeric blocks with at least this many cells use the compiled outlier scan when numba is installed
+NUMBA_MIN_CELLS = 1_000_000
+OUTLIER_SAMPLE_SIZE = 5
+# Box plots are drawn from precomputed quartiles and whiskers plus at most this many of the most extreme points per box
+BOX_MAX_OUTLIER_POINTS = 50
+# Marker traces with more points than this are drawn with WebGL instead of one SVG node per point
+WEBGL_MIN_POINTS = 10_000
+# Frames longer than this feed a fixed-seed row sample to heuristics that only need approximate statistics
+APPROX_ROW_THRESHOLD = 500_000
+APPROX_SAMPLE_ROWS = 200_000
+# Hand-built figure specs skip Plotly's Python validators, so they embed the resolved template rather than its name
+PLOTLY_WHITE_TEMPLATE = pio.templates["plotly_white"].to_plotly_json()
+
+# This function returns the frame itself, or a reproducible row sample of it once it exceeds APPROX_ROW_THRESHOLD
+def _sample_rows(df: pd.DataFrame) -> pd.DataFrame:
+    if len(df) <= APPROX_ROW_THRESHOLD:
+        return df
+    return df.sample(n=APPROX_SAMPLE_ROWS, random_state=0)
+
+# This function counts missing values per column from a single isna() mask over the whole frame
+def count_missing(df: pd.DataFrame) -> pd.Series:
+    return pd.Series(df.isna().to_numpy().sum(axis=0), index=df.columns)
+
+# Per-column statistics shared by the analysis functions, stored as one array per statistic (indexed by
+# column position) so every consumer reads the same scan results instead of re-walking the frame
+@dataclass
+class ColumnStats:
+    names: pd.Index
+    dtypes: np.ndarray      # dtype name per column, e.g. "float64"
+    is_numeric: np.ndarray  # True for columns selected by select_dtypes(include=np.number)
+    na_counts: np.ndarray
+    nuniques: np.ndarray
+    quartiles: np.ndarray   # (2, n_cols) Q1 and Q3; NaN for non-numeric columns
+
+# This function computes ColumnStats in one pass per statistic; pass na_counts and numeric_df when they are already known
+def build_stats(df: pd.DataFrame, na_counts: Optional[pd.Series] = None, numeric_df: Optional[pd.DataFrame] = None) -> ColumnStats:
+    if na_counts is None:
+        na_counts = count_missing(df)
+
+    numerical_df = df.select_dtypes(include=np.number) if numeric_df is None else numeric_df
+    is_numeric = df.columns.isin(numerical_df.columns)
+    quartiles = np.full((2, df.shape[1]), np.nan)
+
+    # Unique counts run over a few contiguous column groups (one per CPU) alongside the quartiles (one call
+    # for every numeric column, estimated from a row sample on huge frames). Hashing numeric columns releases
+    # the GIL, so those groups overlap on multi-core machines; object and string hashing holds it, so text
+    # columns gain nothing. Each group counts column by column: a single-column iloc is a view, whereas
+    # slicing a block of columns would copy it. With one CPU there is nothing to overlap, so df.nunique() is used.
+    n_groups = min(os.cpu_count() or 1, df.shape[1])
+    with ThreadPoolExecutor(max_workers=max(n_groups, 1) + 1) as executor:
+        quartile_task = executor.submit(lambda: _sample_rows(numerical_df).quantile([0.25, 0.75]).to_numpy())
+        if n_groups > 1:
+            column_groups = np.array_split(np.arange(df.shape[1]), n_groups)
+            group_nuniques = executor.map(lambda group: [df.iloc[:, j].nunique() for j in group], column_groups)
+            nuniques = np.array([n for group in group_nuniques for n in group], dtype=np.int64)
+        else:
+            nuniques = df.nunique().to_numpy(dtype=np.int64)
+        quartiles[:, is_numeric] = quartile_task.result()
+
+    return ColumnStats(
+        names=df.columns,
+        dtypes=df.dtypes.astype(str).to_numpy(),
+        is_numeric=is_numeric,
+        na_counts=na_counts.reindex(df.columns).to_numpy(dtype=np.int64),
+        nuniques=nuniques,
+        quartiles=quartiles
+    )
+
+# This function hashes one column to a uint64 per row; adding 0.0 folds -0.0 into 0.0 as duplicated() does
+def _hash_column(series: pd.Series) -> np.ndarray:
+    if series.dtype.kind == "f":
+        series = series + 0.0
+    return pd.util.hash_pandas_object(series, index=False).to_numpy()
+
+# This function counts duplicate rows. DataFrame.duplicated factorizes every column and then repeatedly
+# compresses the combined group index, which gets expensive on wide frames; hashing each column in a thread
+# pool and mixing the hashes row-wise (order-sensitively, so swapped values do not collide) scales linearly.
+# Object and string columns hash more slowly than they factorize, so frames containing any keep using duplicated()
+def _count_duplicate_rows(df: pd.DataFrame) -> int:
+    if len(df) == 0 or df.shape[1] == 0:
+        return 0
+    if any(dtype == object or isinstance(dtype, pd.StringDtype) for dtype in df.dtypes):
+        return int(df.duplicated().to_numpy().sum())
+
+    with ThreadPoolExecutor() as executor:
+        column_hashes = list(executor.map(_hash_column, (df.iloc[:, j] for j in range(df.shape[1]))))
+
+    row_hashes = np.zeros(len(df), dtype=np.uint64)
+    for column_hash in column_hashes:
+        # uint64 array arithmetic wraps on overflow, which is what the mixing relies on; in-place ops
+        # reuse the one row-length buffer instead of allocating two temporaries per column
+        row_hashes *= np.uint64(0x100000001B3)
+        row_hashes += column_hash
+    return len(row_hashes) - len(pd.unique(row_hashes))
+
 # This function takes a DataFrame and returns a dictionary with profiling information
-def profile_data(df: pd.DataFrame) -> dict:
+def profile_data(df: pd.DataFrame, stats: Optional[ColumnStats] = None) -> dict:
     rows =  df.shape[0]
     cols = df.shape[1]
 
-    missing_cells = df.isnull().sum().sum()
+    # Missing counts come from the shared ColumnStats instead of another isnull() scan
+    na_counts = count_missing(df).to_numpy() if stats is None else stats.na_counts
+    missing_cells = int(na_counts.sum())
     total_cells = rows * cols
     missing_percentage = (missing_cells/total_cells)*100 if total_cells > 0 else 0
 
-    duplicate_rows = df.duplicated().sum()
+    # A column holding a distinct non-null value in every row (an ID) means no row can repeat, so the
+    # row-hashing pass is skipped entirely
+    if stats is not None and rows > 0 and (stats.nuniques == rows).any():
+        duplicate_rows = 0
+    else:
+        duplicate_rows = _count_duplicate_rows(df)
     duplicate_percentage = (duplicate_rows/rows)*100 if rows > 0 else 0
 
-    profile = {"Number of Rows": rows, "Number of Columns": cols, "Total Missing Cells": f"{missing_cells} ({missing_percentage:.2f}%)", "Total Duplicate Rows": f"{duplicate_rows} ({duplicate_percentage:.2f}%)"}
+    # Counts stay numeric, paired with their percentage; format_profile_value renders them for display
+    profile = {"Number of Rows": rows, "Number of Columns": cols, "Total Missing Cells": (missing_cells, float(missing_percentage)), "Total Duplicate Rows": (duplicate_rows, float(duplicate_percentage))}
 
     return profile
 
-# This function analyzes each column in the DataFrame and returns a summary DataFrame
-def analyze_columns(df: pd.DataFrame) -> pd.DataFrame:
-    col_analysis = []
-
-    for col in df.columns:
-        dtype = str(df[col].dtype)
-        missing_values = df[col].isnull().sum()
-        total_rows = len(df)
-        missing_percentage = (missing_values / total_rows)*100 if total_rows > 0 else 0
-
-    unique_values = df[col].nunique()
+# This function renders one profile value for display, showing (count, percentage) pairs as "N (x.xx%)"
+def format_profile_value(value) -> str:
+    if isinstance(value, tuple):
+        count, percentage = value
+        return f"{count} ({percentage:.2f}%)"
+    return str(value)
 
-    col_summary = { "Column Name": col, "Data Type": dtype, "Missing Values (%)": f"{missing_percentage:.2f}","Unique Values": unique_values }
+# This function analyzes each column in the DataFrame and returns a summary DataFrame
+def analyze_columns(df: pd.DataFrame, stats: Optional[ColumnStats] = None) -> pd.DataFrame:
+    if stats is None:
+        stats = build_stats(df)
 
-    col_analysis.append(col_summary)
-    summary_df = pd.DataFrame(col_analysis)
+    total_rows = len(df)
+    missing_percentage = stats.na_counts * (100.0 / total_rows) if total_rows > 0 else np.zeros(len(stats.names))
 
-    summary_df = summary_df.set_index("Column Name")
+    summary_df = pd.DataFrame({
+        "Data Type": stats.dtypes,
+        "Missing Values (%)": np.round(missing_percentage, 2),
+        "Unique Values": stats.nuniques
+    }, index=pd.Index(stats.names, name="Column Name"))
 
     return summary_df
 
-# This function creates a histogram for a specified column in the DataFrame
-def create_histogram(df: pd.DataFrame, column: str) -> Figure:
-    fig = px.histogram(df, x=column, title = f"Histogram of {column}", template = "plotly_white")
-
-    return fig
-
-# This function creates a bar plot for the frequency of categories in a specified column
-def create_barplot(df: pd.DataFrame, column: str) -> Figure:
-    value_counts = df[column].value_counts().reset_index()
-    value_counts.columns = [column, 'Count']
-
-    value_counts = value_counts.sort_values(by='Count', ascending=False)
+# This function picks histogram bin edges: one bin per integer for small integer ranges, otherwise the
+# Freedman-Diaconis width, capped at MAX_HISTOGRAM_BINS so heavy-tailed columns cannot explode the bin count
+def _histogram_bin_edges(values: np.ndarray, integer_valued: bool) -> np.ndarray:
+    lo, hi = values.min(), values.max()
+    if lo == hi:
+        return np.array([lo - 0.5, hi + 0.5])
+    if integer_valued and hi - lo < MAX_HISTOGRAM_BINS:
+        return np.arange(lo, hi + 2) - 0.5
+
+    q25, q75 = np.percentile(values, [25, 75])
+    width = 2 * (q75 - q25) / np.cbrt(values.size)
+    n_bins = int(np.ceil((hi - lo) / width)) if width > 0 else int(np.log2(values.size)) + 1
+    return np.linspace(lo, hi, min(max(n_bins, 1), MAX_HISTOGRAM_BINS) + 1)
+
+# This function creates a histogram for a specified column in the DataFrame, returned as a Plotly figure spec (dict)
+def create_histogram(df: pd.DataFrame, column: str) -> dict:
+    # Bin server-side so only the bar heights go over the wire, not every raw value
+    series = df[column]
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[np.isfinite(values)]
+
+    if values.size > 0:
+        counts, edges = np.histogram(values, bins=_histogram_bin_edges(values, series.dtype.kind in "iub"))
+    else:
+        counts, edges = np.array([], dtype=np.int64), np.array([0.0])
+
+    return {
+        "data": [{"type": "bar", "x": (edges[:-1] + edges[1:]) * 0.5, "y": counts, "width": np.diff(edges), "marker": {"line": {"width": 0}}}],
+        "layout": {"title": {"text": f"Histogram of {column}"}, "xaxis": {"title": {"text": column}}, "yaxis": {"title": {"text": "count"}},
+                   "bargap": 0, "template": PLOTLY_WHITE_TEMPLATE}
+    }
+
+# This function creates a bar plot for the frequency of categories in a specified column, returned as a Plotly figure spec (dict)
+def create_barplot(df: pd.DataFrame, column: str) -> dict:
+    # Count through integer codes and partially sort, so high-cardinality columns never build a full sorted value_counts
+    series = df[column]
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Unused categories still get a zero bar, as value_counts gives them
+        codes, uniques = series.cat.codes.to_numpy(), series.cat.categories
+    else:
+        codes, uniques = pd.factorize(series, sort=False)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
 
-    if len(value_counts) > 20:
-        value_counts = value_counts.head(20)
+    if len(counts) > 20:
+        top = np.argpartition(counts, -20)[-20:]
+        top = top[np.argsort(-counts[top], kind='stable')]
         plot_title = f"Top 20 Most Frequent Categories in {column}"
 
     else:
+        top = np.argsort(-counts, kind='stable')
         plot_title = f"Frequency of Categories in {column}"
 
-    fig = px.bar(value_counts, x=column, y='Count', title=plot_title, template="plotly_white")
-
-    return fig
+    # Hover text and axis titles follow plotly express' labelling
+    return {
+        "data": [{"type": "bar", "x": np.asarray(uniques.take(top)), "y": counts[top], "hovertemplate": f"{column}=%{{x}}<br>Count=%{{y}}<extra></extra>"}],
+        "layout": {"title": {"text": plot_title}, "xaxis": {"title": {"text": column}}, "yaxis": {"title": {"text": "Count"}},
+                   "template": PLOTLY_WHITE_TEMPLATE}
+    }
+
+# This function computes a Pearson correlation matrix with a single float32 matrix product (one BLAS sgemm call)
+def _pearson_correlation(numerical_df: pd.DataFrame) -> pd.DataFrame:
+    values = numerical_df.to_numpy(dtype=np.float64)
+
+    # pandas handles missing values pair-by-pair, so only NaN-free frames take the fast path
+    if values.shape[0] < 2 or np.isnan(values).any():
+        return numerical_df.corr()
+
+    # Centre and scale in float64 so columns with a large offset (e.g. epoch timestamps) keep their spread;
+    # only the standardized values are narrowed to float32 for the product
+    centered = values - values.mean(axis=0)
+    # Constant columns are found exactly: a float mean residual would give them a tiny non-zero std
+    constant = np.ptp(values, axis=0) == 0
+    std = centered.std(axis=0, ddof=1)
+    std[constant] = 1.0
+    X = (centered / std).astype(np.float32)
+    corr = np.clip((X.T @ X) / (X.shape[0] - 1), -1.0, 1.0)
+
+    # Rounding in float32 leaves the diagonal a few ulps short of 1; constant columns are NaN, matching DataFrame.corr
+    np.fill_diagonal(corr, 1.0)
+    corr[constant, :] = np.nan
+    corr[:, constant] = np.nan
+
+    return pd.DataFrame(corr, index=numerical_df.columns, columns=numerical_df.columns)
 
 # This function creates a correlation heatmap for the numerical columns in the DataFrame
-def create_correlation_heatmap(df: pd.DataFrame) -> Figure:
-    numerical_df = df.select_dtypes(include = ['int64', 'float64'])
-    correlation_matrix = numerical_df.corr()
-
-    fig = px.imshow(correlation_matrix, text_auto=True, aspect="auto", title="Correlation Matrix", template="plotly_white")
-
+def create_correlation_heatmap(df: pd.DataFrame, numeric_df: Optional[pd.DataFrame] = None) -> Figure:
+    # 200k sampled rows pin Pearson's r to within ~0.01, which the heatmap cannot show anyway
+    numerical_df = _sample_rows(df.select_dtypes(include=np.number) if numeric_df is None else numeric_df)
+    plot_title = "Correlation Matrix"
+    if numerical_df.shape[1] > HEATMAP_MAX_COLUMNS:
+        most_variable = numerical_df.var().nlargest(HEATMAP_MAX_COLUMNS).index
+        numerical_df = numerical_df.loc[:, numerical_df.columns.isin(most_variable)]
+        plot_title = f"Correlation Matrix ({HEATMAP_MAX_COLUMNS} Most Variable Columns)"
+
+    # Plotly sends float32 arrays as base64 typed arrays (4 bytes per cell); its JSON encoder rejects float16.
+    # The heatmap never shows more than three decimals, so round before narrowing.
+    correlation_matrix = _pearson_correlation(numerical_df).round(3).astype(np.float32)
+
+    # The heatmap itself is drawn as a single raster; per-cell text is only worth its SVG nodes on small matrices
+    show_text = correlation_matrix.shape[0] <= HEATMAP_TEXT_MAX_COLUMNS
+    fig = px.imshow(correlation_matrix, text_auto='.2f' if show_text else False, zmin=-1, zmax=1, color_continuous_scale='RdBu',
+                    aspect="auto", title=plot_title, template="plotly_white")
+
+    # Hover reads the float32 cells back as doubles, so format them rather than printing float32 noise digits
+    fig.update_traces(hovertemplate="x: %{x}<br>y: %{y}<br>color: %{z:.3f}<extra></extra>")
     fig.update_layout(title_x=0.5)
 
     return fig
 
 # This function generates a health report for the DataFrame, identifying columns with high missing values, constant columns, and high cardinality columns
-def get_health_report(df: pd.DataFrame) -> dict:
+def get_health_report(df: pd.DataFrame, stats: Optional[ColumnStats] = None) -> dict:
     report = {"high_missing_values": [], "constant_columns": [], "high_cardinality_columns": []}
 
+    if stats is None:
+        stats = build_stats(df)
     total_rows = len(df)
+    if total_rows == 0:
+        return report
 
-    for col in df.columns:
-        missing_percentage = (df[col].isnull().sum() / total_rows) * 100 
-        if missing_percentage > 50:
-            report["high_missing_values"].append((col, f"{missing_percentage:.2f}%"))
-
-        unique_values_count = df[col].nunique()
-        if unique_values_count == 1:
-            report["constant_columns"].append(f"'{col}'")
-
+    # Each check is one boolean mask over the shared per-column arrays. Entries stay numeric (column, missing %)
+    # and (column, unique count) pairs; format_health_report turns them into display strings
+    missing_percentage = stats.na_counts * (100.0 / total_rows)
+    high_missing = missing_percentage > 50
+    report["high_missing_values"] = list(zip(stats.names[high_missing], missing_percentage[high_missing].tolist()))
 
-        cardinality_ratio = unique_values_count / total_rows
-        if cardinality_ratio > 0.95 and unique_values_count > 1:
-            report["high_cardinality_columns"].append(f"'{col}' ({unique_values_count} unique)")
+    report["constant_columns"] = stats.names[stats.nuniques == 1].tolist()
 
+    high_cardinality = (stats.nuniques / total_rows > 0.95) & (stats.nuniques > 1)
+    report["high_cardinality_columns"] = list(zip(stats.names[high_cardinality], stats.nuniques[high_cardinality].tolist()))
 
     return report
 
+# This function renders each health report entry as the display string shown in the app and the HTML report
+def format_health_report(report: dict) -> dict:
+    return {
+        "high_missing_values": [f"{col} ({pct:.2f}%)" for col, pct in report["high_missing_values"]],
+        "constant_columns": [f"'{col}'" for col in report["constant_columns"]],
+        "high_cardinality_columns": [f"'{col}' ({count} unique)" for col, count in report["high_cardinality_columns"]]
+    }
 
-def get_ml_suggestions(df: pd.DataFrame) -> dict:
+
+def get_ml_suggestions(df: pd.DataFrame, stats: Optional[ColumnStats] = None) -> dict:
 
     suggestions = {}
     total_rows = len(df)
     
-    for col in df.columns:
+    # Unique counts, dtypes and skewness are gathered in bulk so the loop below only reads cached scalars
+    if stats is None:
+        stats = build_stats(df)
+    skews = df.select_dtypes(include=[np.number, "bool"]).skew()
+    
+    for col, dtype, nunique in zip(df.columns, df.dtypes, stats.nuniques):
         col_suggestions = {
-            "Role": "Unknown",
-            "Suggestion": "No specific suggestion.",
-            "Code": "# No code snippet available."
+            "role": "Unknown",
+            "suggestion": "No specific suggestion.",
+            "code": "# No code snippet available."
         }
         
-        # --- Heuristics for Role Identification ---
-        nunique = df[col].nunique()
-        dtype = df[col].dtype
-        
         # 1. ID Column Heuristic
         if nunique == total_rows or (nunique / total_rows > 0.95 and pd.api.types.is_string_dtype(dtype)):
             col_suggestions["role"] = "Identifier"
@@ -121,7 +330,7 @@ def get_ml_suggestions(df: pd.DataFrame) -> dict:
             col_suggestions["code"] = f"df_processed = df.drop(columns=['{col}'])"
         
         # 2. Categorical Column Heuristics
-        elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_categorical_dtype(dtype) or (pd.api.types.is_integer_dtype(dtype) and nunique < 25):
+        elif pd.api.types.is_object_dtype(dtype) or isinstance(dtype, (pd.StringDtype, pd.CategoricalDtype)) or (pd.api.types.is_integer_dtype(dtype) and nunique < 25):
             if nunique == 2:
                 col_suggestions["role"] = "Binary Categorical"
                 col_suggestions["suggestion"] = "This is a binary column. Use Label Encoding or One-Hot Encoding."
@@ -142,7 +351,7 @@ def get_ml_suggestions(df: pd.DataFrame) -> dict:
         # 3. Numerical Column Heuristics
         elif pd.api.types.is_numeric_dtype(dtype):
             col_suggestions["role"] = "Numerical"
-            skewness = df[col].skew()
+            skewness = skews.get(col, np.nan)
             if abs(skewness) > 1.5:
                 col_suggestions["suggestion"] = (
                     f"This is a numerical feature. It is highly skewed (skewness = {skewness:.2f}). "
@@ -179,40 +388,93 @@ def get_ml_suggestions(df: pd.DataFrame) -> dict:
         
     return suggestions
 
+if njit is not None:
+    # One streaming pass per column that counts outliers and records the row positions of the first k,
+    # without materializing a rows x cols boolean mask; columns are scanned in parallel
+    @njit(parallel=True, cache=True)
+    def _iqr_scan(values, lower_bound, upper_bound, k):
+        n_rows, n_cols = values.shape
+        counts = np.zeros(n_cols, np.int64)
+        sample_rows = np.full((n_cols, k), -1, np.int64)
+        for j in prange(n_cols):
+            found = 0
+            for i in range(n_rows):
+                v = values[i, j]
+                if v < lower_bound[j] or v > upper_bound[j]:
+                    if found < k:
+                        sample_rows[j, found] = i
+                    found += 1
+            counts[j] = found
+        return counts, sample_rows
+else:
+    _iqr_scan = None
+
+# Streamlit runs each session's script on its own thread, and numba's fallback workqueue threading layer
+# aborts the whole process (uncatchably) when a parallel kernel is entered concurrently, so calls are serialised
+_IQR_SCAN_LOCK = threading.Lock()
+
 # This function detects outliers in numerical columns of a DataFrame using the IQR method
-def detect_outliers(df: pd.DataFrame) -> dict:
+def detect_outliers(df: pd.DataFrame, stats: Optional[ColumnStats] = None, numeric_df: Optional[pd.DataFrame] = None) -> dict:
     outlier_report = {}
-    numerical_cols = df.select_dtypes(include=['int64', 'float64']).columns
+    numerical_df = df.select_dtypes(include=np.number) if numeric_df is None else numeric_df
     
-    for col in numerical_cols:
-        Q1 = df[col].quantile(0.25)
-        Q3 = df[col].quantile(0.75)
-        IQR = Q3 - Q1
-        
-        lower_bound = Q1 - 1.5 * IQR
-        upper_bound = Q3 + 1.5 * IQR
-        
-        # Find the outliers
-        outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)][col]
-        
-        if not outliers.empty:
-            outlier_report[col] = {
-                "count": len(outliers),
-                "percentage": f"{(len(outliers) / len(df) * 100):.2f}%",
-                "sample_values": outliers.head(5).tolist() # Show a sample of 5
-            }
+    # Quartiles come from the shared ColumnStats (estimated from a sample on huge frames), then a single
+    # broadcast comparison over the whole block keeps the counts exact
+    if stats is None:
+        stats = build_stats(numerical_df, numeric_df=numerical_df)
+    Q1, Q3 = stats.quartiles[:, stats.names.get_indexer(numerical_df.columns)]
+    IQR = Q3 - Q1
+    
+    lower_bound = Q1 - 1.5 * IQR
+    upper_bound = Q3 + 1.5 * IQR
+    
+    # Find the outliers (NaNs compare False on both sides)
+    values = numerical_df.to_numpy(dtype=np.float64, na_value=np.nan)
+    if _iqr_scan is not None and values.size >= NUMBA_MIN_CELLS:
+        # Column-major layout keeps each column's scan contiguous in memory
+        values = np.asfortranarray(values)
+        with _IQR_SCAN_LOCK:
+            outlier_counts, sample_rows = _iqr_scan(values, lower_bound, upper_bound, OUTLIER_SAMPLE_SIZE)
+    else:
+        outlier_mask = (values < lower_bound) | (values > upper_bound)
+        outlier_counts = outlier_mask.sum(axis=0)
+        # Only flagged columns need their mask searched for sample positions
+        sample_rows = {j: np.flatnonzero(outlier_mask[:, j])[:OUTLIER_SAMPLE_SIZE] for j in np.flatnonzero(outlier_counts)}
+    
+    total_rows = len(df)
+    columns = numerical_df.columns
+    for j in np.flatnonzero(outlier_counts):
+        col = columns[j]
+        rows = sample_rows[j]
+        outlier_report[col] = {
+            "count": int(outlier_counts[j]),
+            "percentage": float(outlier_counts[j] / total_rows * 100),
+            "sample_values": numerical_df.iloc[:, j].to_numpy()[rows[rows >= 0]].tolist() # Show a sample of 5
+        }
             
     return outlier_report
 
 def create_bivariate_categorical_plot(df: pd.DataFrame, col1: str, col2: str) -> Figure:
-    # Defensive check: Limit cardinality to prevent messy plots
-    if df[col1].nunique() > 20 or df[col2].nunique() > 20:
-        print(f"Warning: '{col1}' or '{col2}' has too many unique values ({df[col1].nunique()}, {df[col2].nunique()}). Plot may be cluttered.")
-        pass
-        
-    fig = px.histogram(
-        df,
+    # Defensive check: Limit cardinality to prevent messy plots, keeping each column's 20 most frequent values
+    n1, n2 = df[col1].nunique(), df[col2].nunique()
+    pair = df[[col1, col2]]
+    if n1 > 20 or n2 > 20:
+        print(f"Warning: '{col1}' or '{col2}' has too many unique values ({n1}, {n2}). Showing the 20 most frequent of each.")
+        keep = np.ones(len(pair), dtype=bool)
+        for col, n_unique in ((col1, n1), (col2, n2)):
+            if n_unique > 20:
+                keep &= pair[col].isin(pair[col].value_counts().index[:20]).to_numpy()
+        pair = pair[keep]
+
+    # Plot the (at most 20 x 20) pair counts rather than handing every row to Plotly to count in the browser
+    counts = pair.groupby([col1, col2], sort=False, observed=True).size().reset_index(name='count')
+    if pd.api.types.is_numeric_dtype(counts[col2]):
+        # px.bar reads a numeric color column as a continuous scale; keep one trace per value as px.histogram did
+        counts[col2] = counts[col2].astype(str)
+    fig = px.bar(
+        counts,
         x=col1,
+        y='count',
         color=col2,
         barmode='group', # Creates grouped bars instead of stacked
         title=f"Interaction between '{col1}' and '{col2}'",
@@ -224,17 +486,54 @@ def create_bivariate_categorical_plot(df: pd.DataFrame, col1: str, col2: str) ->
 
 def create_numerical_vs_categorical_plot(df: pd.DataFrame, num_col: str, cat_col: str) -> Figure:
     # Defensive check: Limit cardinality of the categorical column
-    if df[cat_col].nunique() > 20:
-        print(f"Warning: '{cat_col}' has too many unique values ({df[cat_col].nunique()}). Plot may be cluttered.")
+    n_categories = df[cat_col].nunique()
+    if n_categories > 20:
+        print(f"Warning: '{cat_col}' has too many unique values ({n_categories}). Plot may be cluttered.")
         pass
 
-    fig = px.box(
-        df,
-        x=cat_col,
-        y=num_col,
-        color=cat_col, # Color by the categorical variable
+    # Plotly only needs five numbers per box and the points beyond the whiskers, so those are computed here
+    # instead of shipping every value to the browser
+    values = df[num_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    codes, categories = pd.factorize(df[cat_col], sort=False)
+    present = (codes >= 0) & ~np.isnan(values)
+    values, codes = values[present], codes[present]
+    positions = range(len(categories))
+
+    quantiles = pd.Series(values).groupby(codes).quantile([0.25, 0.5, 0.75]).unstack()
+    q1, median, q3 = quantiles.reindex(index=positions, columns=[0.25, 0.5, 0.75]).to_numpy().T
+    iqr = q3 - q1
+    # Whiskers end at the most extreme values within 1.5 IQR of the box, as Plotly draws them from raw data
+    inside = (values >= (q1 - 1.5 * iqr)[codes]) & (values <= (q3 + 1.5 * iqr)[codes])
+    lowerfence = pd.Series(values[inside]).groupby(codes[inside]).min().reindex(positions).to_numpy()
+    upperfence = pd.Series(values[inside]).groupby(codes[inside]).max().reindex(positions).to_numpy()
+
+    outliers = pd.DataFrame({"code": codes[~inside], "value": values[~inside]})
+    outliers["distance"] = np.abs(outliers["value"].to_numpy() - median[outliers["code"].to_numpy()])
+    outliers = outliers.sort_values("distance", ascending=False).groupby("code").head(BOX_MAX_OUTLIER_POINTS)
+    outlier_values = outliers.groupby("code")["value"].agg(list).to_dict()
+
+    traces = []
+    colors = px.colors.qualitative.Plotly
+    # With many categories the outlier markers alone can reach tens of thousands of points
+    scatter = go.Scattergl if len(outliers) > WEBGL_MIN_POINTS else go.Scatter
+    for box_number, j in enumerate(np.flatnonzero(~np.isnan(median))):
+        category, name = categories[j], str(categories[j])
+        color = colors[box_number % len(colors)]
+        traces.append(go.Box(x=[category], name=name, q1=[q1[j]], median=[median[j]], q3=[q3[j]], lowerfence=[lowerfence[j]],
+                             upperfence=[upperfence[j]], boxpoints=False, marker_color=color, legendgroup=name))
+        points = outlier_values.get(j)
+        if points:
+            traces.append(scatter(x=[category] * len(points), y=points, mode="markers", marker_color=color, legendgroup=name,
+                                     showlegend=False, hovertemplate=f"{cat_col}=%{{x}}<br>{num_col}=%{{y}}<extra></extra>"))
+
+    fig = go.Figure(traces)
+    fig.update_layout(
         title=f"Distribution of '{num_col}' across '{cat_col}' categories",
+        xaxis_title=cat_col,
+        yaxis_title=num_col,
+        legend_title_text=cat_col,
+        boxmode="overlay",
         template="plotly_white"
     )
     fig.update_layout(title_x=0.5)
-    return fig
\ No newline at end of file
+    return fig
@@ -0,0 +1,69 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+# --- On-disk cache of preprocessed uploads ---
+# Streamlit's in-memory caches die with the server process, so preprocessed frames are also written to
+# Parquet keyed on the upload's SHA-256. Re-uploading the same file then skips CSV parsing and
+# datetime/category inference entirely. Most dtypes round-trip through Parquet, but bool-valued categoricals
+# come back as object and Arrow strings with python storage, so load_data re-applies those two conversions.
+CACHE_DIR = Path(os.environ.get("INSTANTEDA_CACHE_DIR", Path.home() / ".cache" / "instanteda"))
+CACHE_MAX_BYTES = 1024 * 1024 * 1024
+# Part of every cache key: bump whenever load_data's preprocessing (datetime, category or string conversion)
+# changes, so frames written by older logic are not served. Stale versions age out through LRU eviction.
+PREPROCESSING_VERSION = 4
+
+
+def _cache_path(file_hash: str) -> Path:
+    return CACHE_DIR / f"{file_hash}-v{PREPROCESSING_VERSION}.parquet"
+
+
+def load_cached_frame(file_hash: str) -> Optional[pd.DataFrame]:
+    """Return the cached frame for this upload, or None on a miss or unreadable entry."""
+    path = _cache_path(file_hash)
+    if not path.exists():
+        return None
+    try:
+        df = pd.read_parquet(path)
+        # Many filesystems mount with relatime, so bump the access time explicitly for LRU eviction
+        os.utime(path)
+        return df
+    except (ImportError, OSError, ValueError):
+        return None
+
+
+def store_cached_frame(file_hash: str, df: pd.DataFrame) -> None:
+    """Write the frame to the cache, silently skipping frames or filesystems that cannot hold it."""
+    path = _cache_path(file_hash)
+    tmp_path = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # A uniquely named temp file per writer, renamed into place, so a concurrent process storing the
+        # same upload can neither interleave with this write nor publish it half-written
+        fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, prefix=f"{file_hash}-", suffix=".parquet.tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        df.to_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, path)
+    except (ImportError, OSError, ValueError, TypeError, NotImplementedError):
+        # e.g. pyarrow missing, read-only home directory, or mixed-type object columns Arrow cannot encode
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        return
+    _evict_least_recently_used()
+
+
+def _evict_least_recently_used() -> None:
+    try:
+        entries = sorted(((p.stat(), p) for p in CACHE_DIR.glob("*.parquet")), key=lambda e: e[0].st_atime, reverse=True)
+        total_bytes = 0
+        for stat, path in entries:
+            total_bytes += stat.st_size
+            if total_bytes > CACHE_MAX_BYTES:
+                path.unlink(missing_ok=True)
+    except OSError:
+        # Another session may be evicting the same files concurrently
+        pass
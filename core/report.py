@@ -1,6 +1,8 @@
 import pandas as pd
+import plotly.io as pio
 from plotly.graph_objects import Figure
 from datetime import datetime
+from core.analyzer import format_health_report, format_profile_value
 
 # --- 1. CSS Stylesheet ---
 REPORT_CSS = """
@@ -118,11 +120,12 @@ def generate_html_report(
 def _generate_profile_html(profile_info: dict) -> str:
     metrics_html = ""
     for key, value in profile_info.items():
-        metrics_html += f"<div class='metric'><h3>{key}</h3><p>{value}</p></div>"
+        metrics_html += f"<div class='metric'><h3>{key}</h3><p>{format_profile_value(value)}</p></div>"
     return f"<div class='section'><h2>Data Profile</h2><div class='metric-grid'>{metrics_html}</div></div>"
 
 def _generate_alerts_html(health_report: dict, outlier_report: dict) -> str:
     html = "<div class='section'><h2>Alerts & Outliers</h2>"
+    health_report = format_health_report(health_report)
     warnings_dict = {"High Missing Values (>50%)": health_report.get('high_missing_values', []), "Constant Columns": health_report.get('constant_columns', [])}
     info_dict = {"High Cardinality (Potential IDs)": health_report.get('high_cardinality_columns', [])}
     html += _format_warnings(warnings_dict, "Data Health Warnings", "warning")
@@ -133,7 +136,7 @@ def _generate_alerts_html(health_report: dict, outlier_report: dict) -> str:
     else:
         html += "<table><thead><tr><th>Column</th><th>Outlier Count</th><th>Outlier %</th><th>Sample Outliers</th></tr></thead><tbody>"
         for col, details in outlier_report.items():
-            html += f"<tr><td>{col}</td><td>{details['count']}</td><td>{details['percentage']}</td><td>{str(details['sample_values'])}</td></tr>"
+            html += f"<tr><td>{col}</td><td>{details['count']}</td><td>{details['percentage']:.2f}%</td><td>{str(details['sample_values'])}</td></tr>"
         html += "</tbody></table>"
     html += "</div>"
     return html
@@ -141,7 +144,8 @@ def _generate_alerts_html(health_report: dict, outlier_report: dict) -> str:
 def _generate_univariate_plots_html(univariate_figs: dict) -> str:
     plots_html = ""
     for col_name, fig in univariate_figs.items():
-        fig_html = fig.to_html(full_html=False, include_plotlyjs='cdn', default_height='450px')
+        # Univariate figures arrive as plain Plotly specs, which are written out without re-validating them
+        fig_html = pio.to_html(fig, full_html=False, include_plotlyjs='cdn', default_height='450px', validate=False)
         plots_html += f"<div><h3>{col_name}</h3>{fig_html}</div>"
     return f"<div class='section'><h2>Univariate Analysis</h2><div class='plot-grid'>{plots_html}</div></div>"
 
@@ -153,7 +157,6 @@ def _format_warnings(report_dict: dict, title: str, alert_type: str = "warning")
     for category, items in report_dict.items():
         if items:
             category_title = category.replace('_', ' ').title()
-            if isinstance(items[0], tuple): items_str = ', '.join([f'{col} ({pct})' for col, pct in items])
-            else: items_str = ', '.join(map(str, items))
+            items_str = ', '.join(map(str, items))
             items_html += f"<li><strong>{category_title}:</strong> {items_str}</li>"
     return html + f"<div class='alert alert-{alert_type}'><ul>{items_html}</ul></div>"
\ No newline at end of file